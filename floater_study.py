@@ -16,11 +16,44 @@ import math
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+import numpy as np
+
+# Numba is optional: with it the hot kernel below is JIT-compiled,
+# without it the same function runs as plain Python.
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def wrapper(func):
+            return func
+        return wrapper
+
+# CUDA is a further optional layer on top of Numba, for very large
+# sweeps (>> 1e6 configs). Absence of a GPU is handled at call time.
+if NUMBA_AVAILABLE:
+    from numba import cuda
+    try:
+        CUDA_AVAILABLE = cuda.is_available()
+    except Exception:
+        CUDA_AVAILABLE = False
+else:
+    cuda = None
+    CUDA_AVAILABLE = False
+
 G = 9.81          # m/s^2
 RHO_W = 1025.0    # kg/m3  (seawater)
 
+# Hoisted to module scope so hot loops skip the math-module attribute
+# lookups; inside njit kernels these globals are frozen as constants.
+_TWO_PI = 2.0 * math.pi
+_SQRT = math.sqrt
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Column:
     """Single vertical column (cylindrical)"""
     radius: float         # radial distance from centerline [m]
@@ -29,14 +62,14 @@ class Column:
     freeboard: float      # height above SWL [m]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MassItem:
     """Lumped mass with vertical position."""
     mass: float           # [t]
     z: float              # [m] (positive upwards, 0 at SWL)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LowerPlates:
     """
     Represent the three radial lower flanges:
@@ -47,7 +80,7 @@ class LowerPlates:
     width: float          # width [m]
 
 
-@dataclass
+@dataclass(slots=True)
 class FloaterConfig:
     columns: List[Column]
     lower_plates: LowerPlates
@@ -61,22 +94,79 @@ class FloaterConfig:
     ref_plate_length: Optional[float] = None         # [m]
     ref_plate_width: Optional[float] = None          # [m]
 
+    # SoA caches built once from the column list (structure-of-arrays,
+    # so the per-column loops become NumPy broadcast ops). compare=False
+    # keeps the derived state out of the dataclass __eq__: ndarray
+    # comparisons do not reduce to a bool, and equality is already
+    # fully determined by the declared inputs above.
+    _radii: np.ndarray = field(init=False, repr=False, compare=False)
+    _diameters: np.ndarray = field(init=False, repr=False, compare=False)
+    _drafts: np.ndarray = field(init=False, repr=False, compare=False)
+    _areas: np.ndarray = field(init=False, repr=False, compare=False)
+    _masses: np.ndarray = field(init=False, repr=False, compare=False)
+    _zs: np.ndarray = field(init=False, repr=False, compare=False)
+    _ref_ratio: float = field(init=False, repr=False, compare=False)
+    _A_ref_inv: Optional[float] = field(init=False, repr=False,
+                                        compare=False)
+    # Memoization state must not leak into equality either: two configs
+    # built from the same inputs stay equal whether or not one of them
+    # has been summarized yet.
+    _summary: Optional["FloaterSummary"] = field(init=False, repr=False,
+                                                 compare=False)
+
+    def __post_init__(self):
+        self._radii = np.fromiter((c.radius for c in self.columns),
+                                  dtype=np.float64)
+        self._diameters = np.fromiter((c.diameter for c in self.columns),
+                                      dtype=np.float64)
+        self._drafts = np.fromiter((c.draft for c in self.columns),
+                                   dtype=np.float64)
+        # Waterplane area per column, shared by displacement / Aw / BM
+        self._areas = math.pi * 0.25 * self._diameters**2
+        self._masses = np.fromiter((m.mass for m in self.mass_items),
+                                   dtype=np.float64)
+        self._zs = np.fromiter((m.z for m in self.mass_items),
+                               dtype=np.float64)
+        # Heave added mass calibration is fixed per config: compute
+        # the reference ratio and inverse reference plate area once.
+        if (self.ref_mass_total is not None
+                and self.ref_C33 is not None
+                and self.ref_T_heave is not None):
+            m_eff_ref = ((self.ref_T_heave / _TWO_PI)**2
+                         * self.ref_C33)
+            self._ref_ratio = ((m_eff_ref - self.ref_mass_total)
+                               / self.ref_mass_total)
+        else:
+            self._ref_ratio = 4.0
+        if (self.ref_plate_length is not None
+                and self.ref_plate_width is not None):
+            self._A_ref_inv = 1.0 / (self.ref_plate_length
+                                     * self.ref_plate_width * 3.0)
+        else:
+            self._A_ref_inv = None
+        self._summary = None
+
+
+def compute_displacement(config: FloaterConfig,
+                         areas: Optional[np.ndarray] = None) -> float:
+    """
+    Displacement volume [m3] from cylindrical columns.
 
-def compute_displacement(config: FloaterConfig) -> float:
-    """Displacement volume [m3] from cylindrical columns."""
-    V = 0.0
-    for col in config.columns:
-        area = math.pi * (col.diameter / 2.0)**2
-        V += area * col.draft
-    return V
+    The per-column waterplane areas are shared between displacement,
+    Aw and BM; they default to the buffer cached on the config, but a
+    caller working with modified geometry can pass its own.
+    """
+    if areas is None:
+        areas = config._areas
+    return float(areas @ config._drafts)
 
 
-def compute_waterplane_area(config: FloaterConfig) -> float:
+def compute_waterplane_area(config: FloaterConfig,
+                            areas: Optional[np.ndarray] = None) -> float:
     """Waterplane area [m2] from column waterplanes."""
-    A = 0.0
-    for col in config.columns:
-        A += math.pi * (col.diameter / 2.0)**2
-    return A
+    if areas is None:
+        areas = config._areas
+    return float(areas.sum())
 
 
 def compute_zB(config: FloaterConfig) -> float:
@@ -90,23 +180,23 @@ def compute_zB(config: FloaterConfig) -> float:
 
 def compute_zG(config: FloaterConfig) -> float:
     """Vertical CoG [m] from mass items (mass in tonnes)."""
-    m_total = sum(m.mass for m in config.mass_items)  # [t]
+    m_total = float(config._masses.sum())  # [t]
     if m_total == 0.0:
         return 0.0
-    zG = sum(m.mass * m.z for m in config.mass_items) / m_total
+    zG = float(np.dot(config._masses, config._zs)) / m_total
     return zG
 
 
-def compute_pitch_BM(config: FloaterConfig, disp_volume: float) -> float:
+def compute_pitch_BM(config: FloaterConfig, disp_volume: float,
+                     areas: Optional[np.ndarray] = None) -> float:
     """
     Approximate BM for pitch/roll using ring-column approximation:
     I_wp ≈ sum( A_col * r^2 / 2 ), then BM = I_wp / ∇.
     """
-    I_wp = 0.0
-    for col in config.columns:
-        A = math.pi * (col.diameter / 2.0)**2
-        # For a ring of columns, pitch inertia about x or y is A*r^2/2
-        I_wp += A * (col.radius**2) / 2.0
+    if areas is None:
+        areas = config._areas
+    # For a ring of columns, pitch inertia about x or y is A*r^2/2
+    I_wp = 0.5 * float((areas * config._radii**2).sum())
     BM = I_wp / disp_volume
     return BM
 
@@ -129,20 +219,10 @@ def calibrate_heave_added_mass_ratio(config: FloaterConfig) -> float:
         ref_C33 [N/m],
         ref_T_heave [s]
     """
-    if config.ref_mass_total is None or config.ref_C33 is None or config.ref_T_heave is None:
-        # Default fallback: assume a33/m ≈ 4
-        return 4.0
-
-    m = config.ref_mass_total
-    C33 = config.ref_C33
-    T = config.ref_T_heave
-
-    # T = 2π * sqrt( (m + a33) / C33 )
-    # => m + a33 = (T/(2π))^2 * C33
-    m_eff = (T / (2.0 * math.pi))**2 * C33
-    a33 = m_eff - m
-    ratio = a33 / m
-    return ratio
+    # T = 2π * sqrt( (m + a33) / C33 ) => m + a33 = (T/(2π))^2 * C33;
+    # precomputed in __post_init__ (defaults to a33/m ≈ 4 without
+    # reference data).
+    return config._ref_ratio
 
 
 def scale_heave_added_mass_ratio(config: FloaterConfig, ref_ratio: float) -> float:
@@ -150,102 +230,517 @@ def scale_heave_added_mass_ratio(config: FloaterConfig, ref_ratio: float) -> flo
     Scale heave added mass ratio from reference using plate area.
     a33_new/m_new ≈ ref_ratio * (B_new * L_new / (B_ref * L_ref))
     """
-    if config.ref_plate_length is None or config.ref_plate_width is None:
+    if config._A_ref_inv is None:
         # No reference plate geometry: just use ref_ratio directly
         return ref_ratio
 
-    # Reference plates (15 MW)
-    A_ref = config.ref_plate_length * config.ref_plate_width * 3.0  # 3 plates
-
-    # New plates
+    # New plate area over reference area (precomputed inverse)
     plates = config.lower_plates
     A_new = plates.length * plates.width * plates.n_plates
-
-    scale = A_new / A_ref
-    return ref_ratio * scale
+    return ref_ratio * A_new * config._A_ref_inv
 
 
 def heave_period(config: FloaterConfig,
                  disp_volume: float,
-                 Aw: float) -> float:
+                 Aw: float,
+                 C33: Optional[float] = None,
+                 m_struct_kg: Optional[float] = None) -> float:
     """
     Compute heave natural period [s], including added mass from lower plates.
     Uses calibration from 15 MW reference if provided.
-    """
-    m_struct = sum(m.mass for m in config.mass_items) * 1000.0  # [kg]
-    C33 = heave_stiffness(config, Aw)
 
-    # 1) calibrate ratio a33/m on reference
-    ref_ratio = calibrate_heave_added_mass_ratio(config)
-
-    # 2) scale with plate area
-    ratio_new = scale_heave_added_mass_ratio(config, ref_ratio)
+    C33 and m_struct_kg can be passed in when already known (e.g. from
+    summarize_floater) to avoid recomputing them.
+    """
+    if m_struct_kg is None:
+        m_struct_kg = float(config._masses.sum()) * 1000.0  # [kg]
+    m_struct = m_struct_kg
+    if C33 is None:
+        C33 = heave_stiffness(config, Aw)
+
+    # Calibrated ratio a33/m scaled with plate area; both the
+    # reference ratio and 1/A_ref are cached on the config.
+    if config._A_ref_inv is not None:
+        plates = config.lower_plates
+        A_new = plates.length * plates.width * plates.n_plates
+        ratio_new = config._ref_ratio * A_new * config._A_ref_inv
+    else:
+        ratio_new = config._ref_ratio
 
     m_eff = m_struct * (1.0 + ratio_new)
 
-    T = 2.0 * math.pi * math.sqrt(m_eff / C33)
+    T = _TWO_PI * _SQRT(m_eff / C33)
     return T
 
 
 def pitch_period(config: FloaterConfig,
-                 GM: float) -> float:
+                 GM: float,
+                 V: Optional[float] = None,
+                 I_struct_kg: Optional[float] = None) -> float:
     """
     Compute pitch/roll natural period [s].
     Uses structural inertia about SWL with respect to a horizontal axis.
-    """
-    # Effective inertia: sum m_i z_i^2. Mass in tonnes.
-    I_struct = 0.0  # [t·m2]
-    for m in config.mass_items:
-        I_struct += m.mass * (m.z**2)
 
-    # Convert t·m2 to kg·m2
-    I_struct *= 1000.0
+    V and I_struct_kg can be passed in when already known to skip the
+    displacement and inertia passes.
+    """
+    if I_struct_kg is None:
+        # Effective inertia: sum m_i z_i^2, mass in tonnes -> kg·m2
+        I_struct_kg = float(np.dot(config._masses,
+                                   config._zs**2)) * 1000.0
+    I_struct = I_struct_kg
 
     # Hydrostatic stiffness
-    V = compute_displacement(config)
+    if V is None:
+        V = compute_displacement(config)
     C_theta = pitch_stiffness(config, V, GM)
 
     # We ignore rotational added inertia; plates contribute but are small
     I_eff = I_struct
 
-    T = 2.0 * math.pi * math.sqrt(I_eff / C_theta)
+    T = _TWO_PI * _SQRT(I_eff / C_theta)
     return T
 
 
-def summarize_floater(config: FloaterConfig) -> None:
-    """Compute and print main hydrostatic properties and eigenperiods."""
-    V = compute_displacement(config)
-    m_disp = V * config.water_density / 1000.0  # [t]
-    Aw = compute_waterplane_area(config)
-    zB = compute_zB(config)
-    zG = compute_zG(config)
-    BG = zG - zB
-    BM = compute_pitch_BM(config, V)
-    GM = BM - BG
+# Explicit signature so both kernels compile once at import time.
+# The added-mass calibration (ref_ratio, A_ref_inv) is precomputed by
+# the callers -- NaN sentinels inside a fastmath kernel are unsafe, and
+# the calibration is constant across a sweep anyway. A_ref_inv <= 0
+# means "no reference plate geometry, use ref_ratio unscaled".
+_EVALUATE_SIG = ('UniTuple(f8, 10)'
+                 '(f8[::1], f8[::1], f8[::1], f8[::1], f8[::1],'
+                 ' f8, f8, f8, f8, f8, f8, f8)')
+
+# Index tuples for the fixed-shape specialization: the reference
+# layout has exactly 7 columns and 4 mass items, and literal_unroll
+# lets LLVM fully unroll + register-allocate those reductions.
+_COL_IDX_7 = (0, 1, 2, 3, 4, 5, 6)
+_MASS_IDX_4 = (0, 1, 2, 3)
+
+
+def _evaluate_impl(diameters, radii, drafts, masses, zs,
+                   plate_len, plate_wid, n_plates,
+                   rho, g, ref_ratio, A_ref_inv):
+    """
+    Full floater evaluation as a pure numeric kernel (Numba-compiled
+    when available; this plain function is the no-Numba fallback).
 
-    C33 = heave_stiffness(config, Aw)
-    Ctheta = pitch_stiffness(config, V, GM)
+    Returns (V, Aw, zB, zG, BM, GM, C33, Ctheta, T_heave, T_pitch).
+    """
+    # Column reductions (explicit loops: njit-friendly)
+    V = 0.0
+    Aw = 0.0
+    I_wp = 0.0
+    draft_sum = 0.0
+    for i in range(diameters.shape[0]):
+        a = math.pi * 0.25 * diameters[i] * diameters[i]
+        V += a * drafts[i]
+        Aw += a
+        I_wp += 0.5 * a * radii[i] * radii[i]
+        draft_sum += drafts[i]
+    zB = -0.5 * draft_sum / diameters.shape[0]
+
+    # Mass-item reductions
+    m_total = 0.0
+    m_moment = 0.0
+    I_struct = 0.0
+    for j in range(masses.shape[0]):
+        m_total += masses[j]
+        m_moment += masses[j] * zs[j]
+        I_struct += masses[j] * zs[j] * zs[j]
+    zG = m_moment / m_total if m_total != 0.0 else 0.0
+
+    BM = I_wp / V
+    GM = BM - (zG - zB)
+
+    C33 = rho * g * Aw
+    Ctheta = rho * g * V * GM
+
+    # Heave added mass: calibrated ratio scaled by plate area
+    ratio = ref_ratio
+    if A_ref_inv > 0.0:
+        ratio *= plate_len * plate_wid * n_plates * A_ref_inv
+
+    m_struct = m_total * 1000.0   # [t] -> [kg]
+    m_eff = m_struct * (1.0 + ratio)
+    T_heave = _TWO_PI * (m_eff / C33)**0.5
+
+    I_struct *= 1000.0            # [t·m2] -> [kg·m2]
+    T_pitch = _TWO_PI * (I_struct / Ctheta)**0.5
+
+    return V, Aw, zB, zG, BM, GM, C33, Ctheta, T_heave, T_pitch
+
+
+if NUMBA_AVAILABLE:
+    from numba import literal_unroll
+
+    _evaluate = njit(_EVALUATE_SIG, cache=True,
+                     fastmath=True)(_evaluate_impl)
+
+    @njit(_EVALUATE_SIG, cache=True, fastmath=True)
+    def _evaluate_7x4(diameters, radii, drafts, masses, zs,
+                      plate_len, plate_wid, n_plates,
+                      rho, g, ref_ratio, A_ref_inv):
+        """Shape-specialized twin of _evaluate for C=7, M=4: the
+        reductions are unrolled over literal index tuples."""
+        V = 0.0
+        Aw = 0.0
+        I_wp = 0.0
+        draft_sum = 0.0
+        for i in literal_unroll(_COL_IDX_7):
+            a = math.pi * 0.25 * diameters[i] * diameters[i]
+            V += a * drafts[i]
+            Aw += a
+            I_wp += 0.5 * a * radii[i] * radii[i]
+            draft_sum += drafts[i]
+        zB = -0.5 * draft_sum / 7.0
+
+        m_total = 0.0
+        m_moment = 0.0
+        I_struct = 0.0
+        for j in literal_unroll(_MASS_IDX_4):
+            m_total += masses[j]
+            m_moment += masses[j] * zs[j]
+            I_struct += masses[j] * zs[j] * zs[j]
+        zG = m_moment / m_total if m_total != 0.0 else 0.0
+
+        BM = I_wp / V
+        GM = BM - (zG - zB)
+
+        C33 = rho * g * Aw
+        Ctheta = rho * g * V * GM
+
+        ratio = ref_ratio
+        if A_ref_inv > 0.0:
+            ratio *= plate_len * plate_wid * n_plates * A_ref_inv
+
+        m_eff = m_total * 1000.0 * (1.0 + ratio)
+        T_heave = _TWO_PI * (m_eff / C33)**0.5
+
+        I_struct *= 1000.0
+        T_pitch = _TWO_PI * (I_struct / Ctheta)**0.5
+
+        return V, Aw, zB, zG, BM, GM, C33, Ctheta, T_heave, T_pitch
+else:
+    _evaluate = _evaluate_impl
+    _evaluate_7x4 = _evaluate_impl
+
+
+def _calibration_params(ref_mass_total: Optional[float],
+                        ref_C33: Optional[float],
+                        ref_T_heave: Optional[float],
+                        ref_plate_length: Optional[float],
+                        ref_plate_width: Optional[float]) -> tuple:
+    """Reduce the optional reference data to the (ref_ratio,
+    A_ref_inv) pair the kernels take; A_ref_inv=0 disables scaling."""
+    if ref_mass_total is None or ref_C33 is None or ref_T_heave is None:
+        ref_ratio = 4.0
+    else:
+        m_eff_ref = (ref_T_heave / _TWO_PI)**2 * ref_C33
+        ref_ratio = (m_eff_ref - ref_mass_total) / ref_mass_total
+    if ref_plate_length is None or ref_plate_width is None:
+        A_ref_inv = 0.0
+    else:
+        A_ref_inv = 1.0 / (ref_plate_length * ref_plate_width * 3.0)
+    return ref_ratio, A_ref_inv
+
+
+def evaluate(config: FloaterConfig) -> tuple:
+    """
+    Evaluate all hydrostatic properties and eigenperiods in one kernel call.
+    Uses the unrolled 7-column / 4-mass specialization when the config
+    matches that shape.
 
-    T_heave = heave_period(config, V, Aw)
-    T_pitch = pitch_period(config, GM)
+    Returns (V, Aw, zB, zG, BM, GM, C33, Ctheta, T_heave, T_pitch).
+    """
+    plates = config.lower_plates
+    kernel = (_evaluate_7x4
+              if len(config.columns) == 7 and len(config.mass_items) == 4
+              else _evaluate)
+    return kernel(
+        config._diameters, config._radii, config._drafts,
+        config._masses, config._zs,
+        plates.length, plates.width, float(plates.n_plates),
+        config.water_density, config.gravity,
+        config._ref_ratio,
+        config._A_ref_inv if config._A_ref_inv is not None else 0.0,
+    )
 
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _evaluate_batch(diameters, radii, drafts, masses, zs,
+                    plate_length, plate_width, n_plates,
+                    rho, g, ref_ratio, A_ref_inv):
+    """
+    Parallel batch kernel: one independent _evaluate call per config,
+    spread over all cores with prange. Returns a [K, 10] result array.
+    """
+    K = diameters.shape[0]
+    specialized = diameters.shape[1] == 7 and masses.shape[1] == 4
+    out = np.empty((K, 10))
+    for k in prange(K):
+        if specialized:
+            res = _evaluate_7x4(diameters[k], radii[k], drafts[k],
+                                masses[k], zs[k],
+                                plate_length[k], plate_width[k],
+                                n_plates[k],
+                                rho, g, ref_ratio, A_ref_inv)
+        else:
+            res = _evaluate(diameters[k], radii[k], drafts[k],
+                            masses[k], zs[k],
+                            plate_length[k], plate_width[k], n_plates[k],
+                            rho, g, ref_ratio, A_ref_inv)
+        out[k, 0] = res[0]
+        out[k, 1] = res[1]
+        out[k, 2] = res[2]
+        out[k, 3] = res[3]
+        out[k, 4] = res[4]
+        out[k, 5] = res[5]
+        out[k, 6] = res[6]
+        out[k, 7] = res[7]
+        out[k, 8] = res[8]
+        out[k, 9] = res[9]
+    return out
+
+
+def evaluate_batch(diameters: np.ndarray,
+                   radii: np.ndarray,
+                   drafts: np.ndarray,
+                   masses: np.ndarray,
+                   zs: np.ndarray,
+                   plate_length: np.ndarray,
+                   plate_width: np.ndarray,
+                   n_plates: np.ndarray,
+                   water_density: float = RHO_W,
+                   gravity: float = G,
+                   ref_mass_total: Optional[float] = None,
+                   ref_C33: Optional[float] = None,
+                   ref_T_heave: Optional[float] = None,
+                   ref_plate_length: Optional[float] = None,
+                   ref_plate_width: Optional[float] = None) -> tuple:
+    """
+    Evaluate K floater configurations at once on stacked arrays.
+
+    Shapes: diameters/radii/drafts are [K, C] (C columns per config),
+    masses/zs are [K, M] (M mass items), plate_length/plate_width/
+    n_plates are [K]. Reference calibration data is shared by the
+    whole sweep.
+
+    Returns (V, Aw, zB, zG, BM, GM, C33, Ctheta, T_heave, T_pitch),
+    each of shape [K].
+
+    With Numba available, the K configs are evaluated in parallel
+    over all cores; otherwise a vectorized NumPy path is used.
+    """
+    ref_ratio, A_ref_inv = _calibration_params(
+        ref_mass_total, ref_C33, ref_T_heave,
+        ref_plate_length, ref_plate_width)
+
+    if NUMBA_AVAILABLE:
+        out = _evaluate_batch(
+            np.ascontiguousarray(diameters, dtype=np.float64),
+            np.ascontiguousarray(radii, dtype=np.float64),
+            np.ascontiguousarray(drafts, dtype=np.float64),
+            np.ascontiguousarray(masses, dtype=np.float64),
+            np.ascontiguousarray(zs, dtype=np.float64),
+            np.asarray(plate_length, dtype=np.float64),
+            np.asarray(plate_width, dtype=np.float64),
+            np.asarray(n_plates, dtype=np.float64),
+            water_density, gravity, ref_ratio, A_ref_inv,
+        )
+        return tuple(out[:, i] for i in range(10))
+
+    areas = np.pi * 0.25 * diameters**2            # [K, C]
+    V = (areas * drafts).sum(axis=1)
+    Aw = areas.sum(axis=1)
+    I_wp = 0.5 * (areas * radii**2).sum(axis=1)
+    zB = -0.5 * drafts.mean(axis=1)
+
+    m_total = masses.sum(axis=1)                   # [t]
+    zG = (masses * zs).sum(axis=1) / m_total
+    I_struct = (masses * zs * zs).sum(axis=1) * 1000.0  # [kg·m2]
+
+    BM = I_wp / V
+    GM = BM - (zG - zB)
+
+    C33 = water_density * gravity * Aw
+    Ctheta = water_density * gravity * V * GM
+
+    ratio = ref_ratio
+    if A_ref_inv > 0.0:
+        ratio = ratio * (plate_length * plate_width * n_plates) * A_ref_inv
+
+    m_eff = m_total * 1000.0 * (1.0 + ratio)
+    T_heave = 2.0 * np.pi * np.sqrt(m_eff / C33)
+    T_pitch = 2.0 * np.pi * np.sqrt(I_struct / Ctheta)
+
+    return V, Aw, zB, zG, BM, GM, C33, Ctheta, T_heave, T_pitch
+
+
+if cuda is not None:
+    @cuda.jit
+    def _evaluate_cuda_kernel(diam, rad, drft, mass, z,
+                              plate_L, plate_W, n_plt,
+                              rho, g, ref_ratio, A_ref_inv,
+                              out_Theave, out_Tpitch, out_GM):
+        """One CUDA thread per candidate floater (same math as
+        _evaluate, reduced to the sweep outputs)."""
+        k = cuda.grid(1)
+        if k >= diam.shape[0]:
+            return
+
+        V = 0.0
+        Aw = 0.0
+        I_wp = 0.0
+        draft_sum = 0.0
+        for i in range(diam.shape[1]):
+            a = math.pi * 0.25 * diam[k, i] * diam[k, i]
+            V += a * drft[k, i]
+            Aw += a
+            I_wp += 0.5 * a * rad[k, i] * rad[k, i]
+            draft_sum += drft[k, i]
+        zB = -0.5 * draft_sum / diam.shape[1]
+
+        m_total = 0.0
+        m_moment = 0.0
+        I_struct = 0.0
+        for j in range(mass.shape[1]):
+            m_total += mass[k, j]
+            m_moment += mass[k, j] * z[k, j]
+            I_struct += mass[k, j] * z[k, j] * z[k, j]
+        zG = m_moment / m_total if m_total != 0.0 else 0.0
+
+        GM = I_wp / V - (zG - zB)
+        C33 = rho * g * Aw
+        Ctheta = rho * g * V * GM
+
+        ratio = ref_ratio
+        if A_ref_inv > 0.0:
+            ratio *= plate_L[k] * plate_W[k] * n_plt[k] * A_ref_inv
+
+        m_eff = m_total * 1000.0 * (1.0 + ratio)
+        out_Theave[k] = _TWO_PI * math.sqrt(m_eff / C33)
+        out_Tpitch[k] = _TWO_PI * math.sqrt(I_struct * 1000.0 / Ctheta)
+        out_GM[k] = GM
+
+
+def evaluate_batch_cuda(diameters: np.ndarray,
+                        radii: np.ndarray,
+                        drafts: np.ndarray,
+                        masses: np.ndarray,
+                        zs: np.ndarray,
+                        plate_length: np.ndarray,
+                        plate_width: np.ndarray,
+                        n_plates: np.ndarray,
+                        water_density: float = RHO_W,
+                        gravity: float = G,
+                        ref_mass_total: Optional[float] = None,
+                        ref_C33: Optional[float] = None,
+                        ref_T_heave: Optional[float] = None,
+                        ref_plate_length: Optional[float] = None,
+                        ref_plate_width: Optional[float] = None) -> tuple:
+    """
+    GPU variant of evaluate_batch for very large sweeps: one CUDA
+    thread per candidate floater. Same array shapes as
+    evaluate_batch.
+
+    Returns (T_heave, T_pitch, GM) as *device* arrays so downstream
+    filtering can stay on the GPU; call .copy_to_host() when done.
+    """
+    if not CUDA_AVAILABLE:
+        raise RuntimeError(
+            "CUDA is not available; use evaluate_batch() instead.")
+
+    ref_ratio, A_ref_inv = _calibration_params(
+        ref_mass_total, ref_C33, ref_T_heave,
+        ref_plate_length, ref_plate_width)
+
+    d_diam = cuda.to_device(np.ascontiguousarray(diameters,
+                                                 dtype=np.float64))
+    d_rad = cuda.to_device(np.ascontiguousarray(radii, dtype=np.float64))
+    d_drft = cuda.to_device(np.ascontiguousarray(drafts,
+                                                 dtype=np.float64))
+    d_mass = cuda.to_device(np.ascontiguousarray(masses,
+                                                 dtype=np.float64))
+    d_z = cuda.to_device(np.ascontiguousarray(zs, dtype=np.float64))
+    d_pL = cuda.to_device(np.asarray(plate_length, dtype=np.float64))
+    d_pW = cuda.to_device(np.asarray(plate_width, dtype=np.float64))
+    d_np = cuda.to_device(np.asarray(n_plates, dtype=np.float64))
+
+    K = diameters.shape[0]
+    out_Theave = cuda.device_array(K)
+    out_Tpitch = cuda.device_array(K)
+    out_GM = cuda.device_array(K)
+
+    threads = 256
+    blocks = (K + threads - 1) // threads
+    _evaluate_cuda_kernel[blocks, threads](
+        d_diam, d_rad, d_drft, d_mass, d_z, d_pL, d_pW, d_np,
+        water_density, gravity, ref_ratio, A_ref_inv,
+        out_Theave, out_Tpitch, out_GM,
+    )
+    return out_Theave, out_Tpitch, out_GM
+
+
+@dataclass(slots=True, frozen=True)
+class FloaterSummary:
+    """All scalar outputs of a floater evaluation (pure data, no I/O)."""
+    V: float              # displacement volume [m3]
+    m_disp: float         # displacement mass [t]
+    Aw: float             # waterplane area [m2]
+    zB: float             # center of buoyancy [m]
+    zG: float             # center of gravity [m]
+    BG: float             # [m]
+    BM: float             # pitch BM [m]
+    GM: float             # pitch GM [m]
+    C33: float            # heave stiffness [N/m]
+    Ctheta: float         # pitch stiffness [Nm/rad]
+    T_heave: float        # [s]
+    T_pitch: float        # [s]
+
+
+def compute_summary(config: FloaterConfig) -> FloaterSummary:
+    """
+    Compute all hydrostatic properties and eigenperiods (no printing).
+    The result is memoized on the config, so repeated calls are free.
+    """
+    if config._summary is None:
+        (V, Aw, zB, zG, BM, GM,
+         C33, Ctheta, T_heave, T_pitch) = evaluate(config)
+        config._summary = FloaterSummary(
+            V=V,
+            m_disp=V * config.water_density / 1000.0,  # [t]
+            Aw=Aw, zB=zB, zG=zG, BG=zG - zB, BM=BM, GM=GM,
+            C33=C33, Ctheta=Ctheta,
+            T_heave=T_heave, T_pitch=T_pitch,
+        )
+    return config._summary
+
+
+def format_summary(s: FloaterSummary) -> None:
+    """Print a floater summary (all I/O lives here, not in compute)."""
     print("=== Floater summary ===")
-    print(f"Displacement volume   : {V:8.1f} m³")
-    print(f"Displacement mass     : {m_disp:8.1f} t")
-    print(f"Waterplane area       : {Aw:8.1f} m²")
-    print(f"zB (CoB)              : {zB:8.2f} m")
-    print(f"zG (CoG)              : {zG:8.2f} m")
-    print(f"BG                    : {BG:8.2f} m")
-    print(f"BM (pitch)            : {BM:8.2f} m")
-    print(f"GM (pitch)            : {GM:8.2f} m")
-    print(f"C33 (heave stiff.)    : {C33:8.3e} N/m")
-    print(f"Cθ  (pitch stiff.)    : {Ctheta:8.3e} Nm/rad")
+    print(f"Displacement volume   : {s.V:8.1f} m³")
+    print(f"Displacement mass     : {s.m_disp:8.1f} t")
+    print(f"Waterplane area       : {s.Aw:8.1f} m²")
+    print(f"zB (CoB)              : {s.zB:8.2f} m")
+    print(f"zG (CoG)              : {s.zG:8.2f} m")
+    print(f"BG                    : {s.BG:8.2f} m")
+    print(f"BM (pitch)            : {s.BM:8.2f} m")
+    print(f"GM (pitch)            : {s.GM:8.2f} m")
+    print(f"C33 (heave stiff.)    : {s.C33:8.3e} N/m")
+    print(f"Cθ  (pitch stiff.)    : {s.Ctheta:8.3e} Nm/rad")
     print()
-    print(f"Heave period T33      : {T_heave:6.2f} s")
-    print(f"Pitch/Roll period Tθ  : {T_pitch:6.2f} s")
+    print(f"Heave period T33      : {s.T_heave:6.2f} s")
+    print(f"Pitch/Roll period Tθ  : {s.T_pitch:6.2f} s")
     print("=======================")
 
 
+def summarize_floater(config: FloaterConfig) -> None:
+    """Compute and print main hydrostatic properties and eigenperiods."""
+    format_summary(compute_summary(config))
+
+
 def main():
     # ---------------------------
     # Example: 24 MW, 6+1 layout
@@ -309,6 +804,67 @@ def main():
 
     summarize_floater(config)
 
+    # ------------------------------------------------------------
+    # Parameter sweep: vary R_out and ballast depth over a grid and
+    # evaluate all variants in one batched call. Plate width stays
+    # fixed: it affects only the heave period, not the GM and pitch
+    # period the Pareto front below is built on, so sweeping it
+    # would only produce exact ties.
+    # ------------------------------------------------------------
+    R_out_grid = np.linspace(70.0, 95.0, 101)
+    zball_grid = np.linspace(-24.0, -12.0, 61)
+
+    R_out_k, zball_k = (a.ravel() for a in
+                        np.meshgrid(R_out_grid, zball_grid,
+                                    indexing="ij"))
+    K = R_out_k.size
+
+    # Stack the 6+1 column layout for every variant [K, 7]
+    diameters = np.full((K, 7), 9.0)
+    diameters[:, 6] = 10.0
+    radii = np.empty((K, 7))
+    radii[:, 0:3] = R_in
+    radii[:, 3:6] = R_out_k[:, None]
+    radii[:, 6] = 0.0
+    drafts_arr = np.full((K, 7), draft)
+
+    # Mass items [K, 4]: tower, RNA, steel fixed; ballast z varies
+    masses = np.tile(np.array([1170.0, 1350.0, 5100.0, 4000.0]), (K, 1))
+    zs = np.tile(np.array([80.0, 160.0, -5.0, 0.0]), (K, 1))
+    zs[:, 3] = zball_k
+
+    plate_L = R_out_k.copy()
+    plate_W = np.full(K, lower_plates.width)
+    n_plt = np.full(K, 3.0)
+
+    (_, _, _, _, _, GM_k, _, _,
+     T_heave_k, T_pitch_k) = evaluate_batch(
+        diameters, radii, drafts_arr, masses, zs,
+        plate_L, plate_W, n_plt,
+        ref_mass_total=ref_disp_mass,
+        ref_C33=C33_ref,
+        ref_T_heave=T_heave_ref,
+        ref_plate_length=R_ref,
+        ref_plate_width=B_ref,
+    )
+
+    # Pareto front: maximize GM (stability) and pitch period
+    # (softness) -- these pull in opposite directions.
+    order = np.argsort(-GM_k)
+    best_T = -np.inf
+    pareto = []
+    for k in order:
+        if T_pitch_k[k] > best_T:
+            best_T = T_pitch_k[k]
+            pareto.append(k)
+
+    print()
+    print(f"=== Sweep: {K} variants, {len(pareto)} Pareto-optimal ===")
+    print(" R_out  z_ball      GM    T33  Tpitch")
+    for k in pareto[:15]:
+        print(f"{R_out_k[k]:6.1f} {zball_k[k]:7.1f} "
+              f"{GM_k[k]:7.2f} {T_heave_k[k]:6.2f} {T_pitch_k[k]:7.2f}")
+
 
 if __name__ == "__main__":
     main()